@@ -1,16 +1,29 @@
-from flask import Flask, render_template, request, redirect, url_for, flash, send_file
+from flask import Flask, render_template, request, redirect, url_for, flash, send_file, send_from_directory, abort
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import or_, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import make_transient_to_detached
 from flask_login import LoginManager, UserMixin, login_user, logout_user, login_required, current_user
-from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime
+from werkzeug.security import generate_password_hash, check_password_hash, safe_join
+from datetime import datetime, timedelta
 import json
 import csv
 import io
+import os
+import gzip
+import mimetypes
+import time
+import uuid
+import click
 from matching import rank_categories
 from revenue_calculator import estimate_revenue
+from cache import TTLCache
+from pagination import keyset_page
+from quota import QuotaManager
+import assets
 import json
 from config import Config
-from reddit_oauth_analyzer import RedditOAuthAnalyzer
+from reddit_oauth_analyzer import RedditOAuthAnalyzer, AnalysisIncomplete, CATEGORIES
 
 # Initialize
 app = Flask(__name__)
@@ -29,6 +42,13 @@ analyzer = RedditOAuthAnalyzer(
     reddit_password=app.config['REDDIT_PASSWORD']
 )
 
+# Per-process caches keyed by user id, see load_user / get_user_profile
+user_cache = TTLCache(Config.USER_CACHE_TTL)
+profile_cache = TTLCache(Config.USER_CACHE_TTL)
+
+# Fingerprinted static files, produced by `python assets.py`
+asset_manifest = assets.load_manifest()
+
 # Database Models
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -45,6 +65,7 @@ class User(UserMixin, db.Model):
         return check_password_hash(self.password_hash, password)
     
     def can_analyze(self):
+        # Display only; /analyze enforces the limit with QuotaManager.reserve
         return self.is_pro or self.analyses_used < Config.FREE_TIER_LIMIT
     # In app.py, add new model:
 
@@ -65,10 +86,148 @@ class Analysis(db.Model):
     results = db.Column(db.Text, nullable=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     num_opportunities = db.Column(db.Integer, default=0)
+    
+    __table_args__ = (
+        db.Index('ix_analysis_user_created', 'user_id', 'created_at', 'id'),
+    )
+
+class Opportunity(db.Model):
+    """One scored post of an Analysis, stored as a row so it can be paged and filtered"""
+    id = db.Column(db.Integer, primary_key=True)
+    analysis_id = db.Column(db.Integer, db.ForeignKey('analysis.id'), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
+    post_id = db.Column(db.String(20), nullable=False)  # Reddit id, used by /problem/<id>
+    score = db.Column(db.Integer, nullable=False, default=0)  # opportunity_score
+    recommendation = db.Column(db.String(30))
+    willingness_to_pay = db.Column(db.String(20))
+    created_utc = db.Column(db.Float, nullable=False, default=0)  # Reddit post date
+    data = db.Column(db.Text, nullable=False)  # full result JSON
+    
+    __table_args__ = (
+        db.Index('ix_opportunity_analysis_score', 'analysis_id', 'score', 'id'),
+        db.Index('ix_opportunity_analysis_date', 'analysis_id', 'created_utc', 'id'),
+        db.Index('ix_opportunity_user_post', 'user_id', 'post_id'),
+        db.Index('ux_opportunity_analysis_post', 'analysis_id', 'post_id', unique=True),
+    )
+
+class CategorySnapshot(db.Model):
+    """Shared analysis output for a catalog category, refreshed by `flask warmup`"""
+    id = db.Column(db.Integer, primary_key=True)
+    category = db.Column(db.String(100), nullable=False, index=True)
+    results = db.Column(db.Text, nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, index=True)
+    num_opportunities = db.Column(db.Integer, default=0)
+
+class AnalysisRun(db.Model):
+    """Checkpoint of an analyze_category run so a retry can resume it
+    
+    At most one run per claim_key is 'running'. The worker whose token is in
+    owner holds it for as long as it keeps updated_at fresh, see claim_run.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    claim_key = db.Column(db.String(150), nullable=False)  # "<user id or warmup>:<snapshot key>"
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)  # None for warm-up runs
+    category = db.Column(db.String(100), nullable=False)  # snapshot_key of the request
+    status = db.Column(db.String(20), default='running', index=True)  # running / complete / abandoned
+    owner = db.Column(db.String(32))  # lease token of the worker running it, None once released
+    quota_reserved = db.Column(db.Boolean, default=False)  # holds one analyses_used slot
+    checkpoint = db.Column(db.Text, default='{}')  # JSON progress from the analyzer
+    analysis_id = db.Column(db.Integer, db.ForeignKey('analysis.id'), nullable=True)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow)  # heartbeat, bumped by every checkpoint
+    
+    __table_args__ = (
+        db.Index('ux_analysis_run_active', 'claim_key', unique=True,
+                 sqlite_where=db.text("status = 'running'"),
+                 postgresql_where=db.text("status = 'running'")),
+    )
+
+USER_CACHE_FIELDS = ('id', 'email', 'password_hash', 'created_at', 'analyses_used', 'is_pro')
+
+quota = QuotaManager(db, User, Config.FREE_TIER_LIMIT)
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    user_id = int(user_id)
+    data = user_cache.get(user_id)
+    
+    if data is None:
+        user = User.query.get(user_id)
+        if user:
+            user_cache.set(user_id, {field: getattr(user, field) for field in USER_CACHE_FIELDS})
+        return user
+    
+    # Attach a copy built from the cached columns without a SELECT
+    user = User(**data)
+    make_transient_to_detached(user)
+    return db.session.merge(user, load=False)
+
+def invalidate_user_cache(user_id):
+    """Call after changing quota or profile fields of a user"""
+    user_cache.invalidate(user_id)
+    profile_cache.invalidate(user_id)
+
+# Static assets and compression
+
+COMPRESSIBLE_MIMETYPES = ('text/html', 'application/json')
+
+@app.template_global()
+def asset_url(filename):
+    """Fingerprinted URL for a static file, or the plain one if assets aren't built"""
+    hashed = asset_manifest.get(filename)
+    if hashed:
+        return url_for('built_asset', filename=hashed)
+    return url_for('static', filename=filename)
+
+@app.route('/assets/<path:filename>')
+def built_asset(filename):
+    """Serve a fingerprinted file, preferring a precompressed variant"""
+    # Only hashed build outputs are safe to mark immutable (not manifest.json)
+    if filename not in asset_manifest.values():
+        abort(404)
+    
+    path, encoding = filename, None
+    for candidate, suffix in (('br', '.br'), ('gzip', '.gz')):
+        full_path = safe_join(assets.DIST_DIR, filename + suffix)
+        if request.accept_encodings[candidate] and full_path and os.path.isfile(full_path):
+            path, encoding = filename + suffix, candidate
+            break
+    
+    response = send_from_directory(
+        assets.DIST_DIR, path,
+        mimetype=mimetypes.guess_type(filename)[0],
+        max_age=Config.ASSET_MAX_AGE
+    )
+    if encoding:
+        response.headers['Content-Encoding'] = encoding
+    response.headers['Cache-Control'] = f'public, max-age={Config.ASSET_MAX_AGE}, immutable'
+    response.vary.add('Accept-Encoding')
+    return response
+
+@app.after_request
+def compress_response(response):
+    """Gzip HTML/JSON responses above COMPRESS_MIN_SIZE for clients that accept it"""
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return response
+    
+    # Set even when this response goes out uncompressed, so caches keep
+    # the gzip and identity variants apart
+    response.vary.add('Accept-Encoding')
+    
+    if (response.status_code != 200
+            or response.direct_passthrough
+            or response.is_streamed
+            or 'Content-Encoding' in response.headers
+            or not request.accept_encodings['gzip']):
+        return response
+    
+    data = response.get_data()
+    if len(data) < Config.COMPRESS_MIN_SIZE:
+        return response
+    
+    response.set_data(gzip.compress(data, compresslevel=6))
+    response.headers['Content-Encoding'] = 'gzip'
+    return response
 
 # Routes
 @app.route('/')
@@ -122,41 +281,76 @@ def logout():
 @app.route('/dashboard')
 @login_required
 def dashboard():
-    analyses = Analysis.query.filter_by(user_id=current_user.id)\
-        .order_by(Analysis.created_at.desc()).limit(10).all()
+    analyses, next_cursor = keyset_page(
+        Analysis.query.filter_by(user_id=current_user.id),
+        Analysis.created_at, Analysis.id,
+        cursor=request.args.get('cursor'),
+        per_page=Config.HISTORY_PAGE_SIZE
+    )
     
     return render_template('dashboard.html',
                          user=current_user,
                          analyses=analyses,
+                         next_cursor=next_cursor,
                          free_limit=Config.FREE_TIER_LIMIT)
 
 @app.route('/analyze', methods=['POST'])
 @login_required
 def analyze():
-    if not current_user.can_analyze():
-        flash('Free tier limit reached!', 'error')
-        return redirect(url_for('dashboard'))
-    
+    user_id = current_user.id
+    email = current_user.email
     category = request.form.get('category')
     
+    # At most one running AnalysisRun per user and snapshot key, across
+    # every worker, so duplicate submissions are turned away here
+    run = claim_run(category, user_id=user_id)
+    if run is None:
+        flash('This analysis is already running', 'error')
+        return redirect(url_for('personalized_dashboard'))
+    
     try:
-        print(f"\n⏱️  Starting analysis for {current_user.email}...")
+        # Take the quota slot before any Reddit or Groq work, recorded on the
+        # run in the same commit. A run resumed after its worker died
+        # already holds one.
+        if not run.quota_reserved:
+            if not quota.reserve(user_id):
+                db.session.rollback()
+                release_run(run)
+                flash('Free tier limit reached!', 'error')
+                return redirect(url_for('dashboard'))
+            save_run(run, quota_reserved=True)
+            db.session.commit()
+            invalidate_user_cache(user_id)
         
-        results = analyzer.analyze_idea(category)
+        snapshot = get_fresh_snapshot(category)
+        
+        if snapshot:
+            print(f"\n⚡ Serving {email} from snapshot #{snapshot.id}")
+            results = json.loads(snapshot.results)
+        else:
+            print(f"\n⏱️  Starting analysis for {email}...")
+            results = run_analysis(run)
+            if results:
+                save_snapshot(category, results)
         
         analysis = Analysis(
-            user_id=current_user.id,
+            user_id=user_id,
             category=category,
             results=json.dumps(results),
             num_opportunities=len(results)
         )
         db.session.add(analysis)
+        add_opportunities(analysis, results)
         
-        current_user.analyses_used += 1
+        # Analysis and run status are committed together
+        finish_run(run, analysis)
         db.session.commit()
         return redirect(url_for('results_chart', analysis_id=analysis.id))
     
     except Exception as e:
+        db.session.rollback()
+        if release_run(run, refund_quota=True):
+            invalidate_user_cache(user_id)
         flash(f'Error: {str(e)}', 'error')
         return redirect(url_for('personalized_dashboard'))
 
@@ -170,11 +364,13 @@ def results(analysis_id):
         flash('Access denied', 'error')
         return redirect(url_for('dashboard'))
     
-    results_data = json.loads(analysis.results)
+    results_data, next_cursor, filters = get_opportunity_page(analysis.id)
     
     return render_template('results.html',
                          analysis=analysis,
-                         results=results_data[:15])
+                         results=results_data,
+                         next_cursor=next_cursor,
+                         filters=filters)
 
 @app.route('/export/<int:analysis_id>')
 @login_required
@@ -241,19 +437,13 @@ def results_chart(analysis_id):
         flash('Access denied', 'error')
         return redirect(url_for('dashboard'))
     
-    results_data = json.loads(analysis.results)
-    
-    # Take top 15 for chart
-    top_results = results_data[:15]
+    results_data, next_cursor, filters = get_opportunity_page(analysis.id)
     
     return render_template('results_chart.html',
                          analysis=analysis,
-                         results=top_results)
-
-# Initialize database
-with app.app_context():
-    db.create_all()
-
+                         results=results_data,
+                         next_cursor=next_cursor,
+                         filters=filters)
 
     # In app.py:
 
@@ -261,12 +451,11 @@ with app.app_context():
 @login_required
 def onboarding():
     if request.method == 'POST':
-        profile = UserProfile.query.filter_by(user_id=current_user.id).first()
-        # Check if user has completed onboarding
-        profile_data = get_user_profile(current_user.id)
-    
+        user_id = current_user.id
+        profile = UserProfile.query.filter_by(user_id=user_id).first()
+        
         if not profile:
-            profile = UserProfile(user_id=current_user.id)
+            profile = UserProfile(user_id=user_id)
         
         profile.background = request.form.get('background')
         profile.interests = json.dumps(request.form.getlist('interests'))
@@ -276,6 +465,7 @@ def onboarding():
         
         db.session.add(profile)
         db.session.commit()
+        invalidate_user_cache(user_id)
         
         return redirect(url_for('personalized_dashboard'))
     
@@ -300,30 +490,17 @@ def onboarding():
 def problem_detail(problem_id):
     """Show detailed view of a single problem"""
     
-    # Find the analysis containing this problem
-    # (In real app, you'd store problems separately)
-    # For now, search through user's recent analyses
-    
-    analyses = Analysis.query.filter_by(user_id=current_user.id)\
-        .order_by(Analysis.created_at.desc()).limit(10).all()
-    
-    problem = None
-    analysis_id = None
+    # Newest analysis of this user containing the problem
+    opportunity = Opportunity.query.filter_by(user_id=current_user.id, post_id=problem_id)\
+        .order_by(Opportunity.id.desc()).first()
     
-    for analysis in analyses:
-        results = json.loads(analysis.results)
-        for result in results:
-            if result['id'] == problem_id:
-                problem = result
-                analysis_id = analysis.id
-                break
-        if problem:
-            break
-    
-    if not problem:
+    if not opportunity:
         flash('Problem not found', 'error')
         return redirect(url_for('dashboard'))
     
+    problem = json.loads(opportunity.data)
+    analysis_id = opportunity.analysis_id
+    
     # Calculate revenue projections
     revenue = estimate_revenue(problem['analysis'])
     
@@ -339,14 +516,372 @@ def problem_detail(problem_id):
 # Helper function in app.py:
 
 def get_user_profile(user_id):
+    profile_data = profile_cache.get(user_id)
+    if profile_data is not None:
+        return profile_data
+    
     profile = UserProfile.query.filter_by(user_id=user_id).first()
     if profile:
-        return {
+        profile_data = {
             'background': profile.background,
             'interests': json.loads(profile.interests),
             'time_available': profile.time_available,
             'budget': profile.budget
         }
+        # Misses are not cached: onboarding on another worker can't
+        # invalidate this process, and a cached None would bounce the
+        # user back to onboarding until the entry expired
+        profile_cache.set(user_id, profile_data)
+    
+    return profile_data
+
+# Opportunities
+
+OPPORTUNITY_SORTS = {
+    'score': Opportunity.score,
+    'date': Opportunity.created_utc
+}
+
+def add_opportunities(analysis, results):
+    """Store each result of an analysis as an Opportunity row (caller commits)"""
+    db.session.flush()
+    db.session.add_all([
+        Opportunity(
+            analysis_id=analysis.id,
+            user_id=analysis.user_id,
+            post_id=result['id'],
+            score=result['analysis']['opportunity_score'],
+            recommendation=result['analysis'].get('recommendation'),
+            willingness_to_pay=result['analysis'].get('willingness_to_pay'),
+            created_utc=result.get('created_utc') or 0,
+            data=json.dumps(result)
+        )
+        for result in results
+    ])
+
+def get_opportunity_page(analysis_id):
+    """Page of an analysis' results for the sort/filter/cursor query args
+    
+    Returns (results, next_cursor, filters); filters holds the normalized
+    query args so templates can build the next-page and filter links.
+    """
+    sort = request.args.get('sort', 'score')
+    if sort not in OPPORTUNITY_SORTS:
+        sort = 'score'
+    
+    filters = {
+        'sort': sort,
+        'recommendation': request.args.get('recommendation', ''),
+        'wtp': request.args.get('wtp', ''),
+        'start': request.args.get('start', 0, type=int)
+    }
+    
+    query = Opportunity.query.filter_by(analysis_id=analysis_id)
+    if filters['recommendation']:
+        query = query.filter_by(recommendation=filters['recommendation'])
+    if filters['wtp']:
+        query = query.filter_by(willingness_to_pay=filters['wtp'])
+    
+    rows, next_cursor = keyset_page(
+        query, OPPORTUNITY_SORTS[sort], Opportunity.id,
+        cursor=request.args.get('cursor'),
+        per_page=Config.RESULTS_PAGE_SIZE
+    )
+    
+    return [json.loads(row.data) for row in rows], next_cursor, filters
+
+def backfill_opportunities(batch_size=50):
+    """Create Opportunity rows for analyses saved before the table existed
+    
+    Each analysis is committed on its own. If another process got there
+    first, the unique (analysis_id, post_id) index rejects the rows and
+    the analysis is skipped.
+    """
+    last_id = 0
+    filled = 0
+    while True:
+        analyses = Analysis.query\
+            .outerjoin(Opportunity, Opportunity.analysis_id == Analysis.id)\
+            .filter(Opportunity.id.is_(None), Analysis.num_opportunities > 0)\
+            .filter(Analysis.id > last_id)\
+            .order_by(Analysis.id).limit(batch_size).all()
+        
+        if not analyses:
+            break
+        
+        last_id = analyses[-1].id
+        for analysis in analyses:
+            add_opportunities(analysis, json.loads(analysis.results))
+            try:
+                db.session.commit()
+                filled += 1
+            except IntegrityError:
+                db.session.rollback()
+    
+    print(f"📦 Backfilled opportunities for {filled} analyses")
+    return filled
+
+@app.cli.command('backfill-opportunities')
+def backfill_opportunities_command():
+    """One-off: create Opportunity rows for analyses from before paging"""
+    backfill_opportunities()
+
+# Checkpointed runs
+
+class RunTakenOver(Exception):
+    """Another worker took over the AnalysisRun this request was working on"""
+
+def claim_run(category, user_id=None):
+    """Lease the running AnalysisRun for (user, category), creating it if needed
+    
+    Returns None while another worker holds the run, i.e. it has an owner
+    and was checkpointed within RUN_STALL_TIMEOUT. A stalled or released
+    run is taken over with a conditional UPDATE so only one worker wins,
+    and resumed from its checkpoint. Runs idle past RUN_RESUME_WINDOW are
+    swept first, so a new run is started for those instead.
+    """
+    sweep_abandoned_runs()
+    
+    key = snapshot_key(category)
+    claim_key = f"{user_id or 'warmup'}:{key}"
+    token = uuid.uuid4().hex
+    now = datetime.utcnow()
+    
+    run = AnalysisRun.query.filter_by(claim_key=claim_key, status='running').first()
+    
+    if run is None:
+        run = AnalysisRun(claim_key=claim_key, user_id=user_id, category=key,
+                          owner=token, updated_at=now)
+        db.session.add(run)
+        try:
+            db.session.commit()
+        except IntegrityError:
+            # Another worker created the run first
+            db.session.rollback()
+            return None
+        run.lease_token = token
+        return run
+    
+    stalled = now - timedelta(seconds=Config.RUN_STALL_TIMEOUT)
+    claimed = db.session.execute(
+        update(AnalysisRun)
+        .where(AnalysisRun.id == run.id, AnalysisRun.status == 'running')
+        .where(or_(AnalysisRun.owner.is_(None), AnalysisRun.updated_at < stalled))
+        .values(owner=token, updated_at=now)
+        .execution_options(synchronize_session=False)
+    ).rowcount
+    db.session.commit()
+    
+    if not claimed:
+        return None
+    
+    # Plain attribute, so refreshing the row can't swap in another worker's token
+    run.lease_token = token
+    print(f"♻️  Resuming run #{run.id} for {key}")
+    return run
+
+def sweep_abandoned_runs():
+    """Close running runs idle past RUN_RESUME_WINDOW and refund their slots
+    
+    A worker killed mid-run never releases its quota reservation, so this
+    hands it back. Each run is closed with a conditional UPDATE committed
+    together with its refund, so a run is refunded at most once even when
+    several workers sweep at the same time.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=Config.RUN_RESUME_WINDOW)
+    runs = AnalysisRun.query\
+        .filter(AnalysisRun.status == 'running', AnalysisRun.updated_at < cutoff)\
+        .all()
+    
+    for run in runs:
+        run_id, user_id, reserved = run.id, run.user_id, bool(run.quota_reserved)
+        closed = db.session.execute(
+            update(AnalysisRun)
+            .where(AnalysisRun.id == run_id, AnalysisRun.status == 'running')
+            .where(AnalysisRun.updated_at < cutoff)
+            .values(status='abandoned', owner=None, quota_reserved=False,
+                    checkpoint='{}', updated_at=datetime.utcnow())
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        
+        if closed and reserved:
+            quota.release(user_id)
+        db.session.commit()
+        
+        if closed:
+            print(f"🧹 Closed abandoned run #{run_id}" + (" and refunded its slot" if reserved else ""))
+            if reserved:
+                invalidate_user_cache(user_id)
+
+def save_run(run, **values):
+    """Update a run we hold a lease on (caller commits)
+    
+    Raises RunTakenOver if another worker has claimed it in the meantime.
+    """
+    values.setdefault('updated_at', datetime.utcnow())
+    result = db.session.execute(
+        update(AnalysisRun)
+        .where(AnalysisRun.id == run.id, AnalysisRun.owner == run.lease_token)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        raise RunTakenOver(f"Run #{run.id} was taken over by another worker")
+
+def release_run(run, refund_quota=False):
+    """Drop our lease after a failure so a retry can resume the run at once
+    
+    With refund_quota, a quota slot held by the run is handed back in the
+    same transaction. Returns True if a slot was refunded.
+    """
+    refund = refund_quota and run.quota_reserved
+    try:
+        if refund:
+            save_run(run, owner=None, quota_reserved=False)
+            quota.release(run.user_id)
+        else:
+            save_run(run, owner=None)
+        db.session.commit()
+    except RunTakenOver:
+        db.session.rollback()
+        return False
+    return refund
+
+def run_analysis(run):
+    """Run analyze_category for a claimed run, checkpointing into it
+    
+    Posts whose AI call failed are retried from the checkpoint until they
+    succeed or hit POST_MAX_ATTEMPTS. The run stays 'running' until the
+    caller passes it to finish_run.
+    """
+    checkpoint = json.loads(run.checkpoint or '{}')
+    
+    def save_checkpoint(state):
+        save_run(run, checkpoint=json.dumps(state))
+        db.session.commit()
+    
+    while True:
+        try:
+            return analyzer.analyze_category(
+                run.category,
+                checkpoint=checkpoint,
+                on_checkpoint=save_checkpoint,
+                max_attempts=Config.POST_MAX_ATTEMPTS
+            )
+        except AnalysisIncomplete as e:
+            # Every pass spends one attempt per failed post, so this ends
+            print(f"🔁 {e}")
+
+def finish_run(run, analysis=None):
+    """Mark a run we hold complete in the caller's transaction (caller commits)"""
+    values = {'status': 'complete', 'owner': None, 'checkpoint': '{}'}
+    if analysis is not None:
+        db.session.flush()
+        values['analysis_id'] = analysis.id
+    save_run(run, **values)
+
+# Shared category snapshots
+
+def snapshot_key(category):
+    """Map a requested category onto the catalog entry scrape_posts would use"""
+    category = (category or '').lower()
+    return category if category in CATEGORIES else 'general'
+
+def category_groups():
+    """Catalog categories grouped by identical subreddit/keyword config"""
+    groups = {}
+    for category, config in CATEGORIES.items():
+        signature = (tuple(config['subreddits']), tuple(config['keywords']))
+        groups.setdefault(signature, []).append(category)
+    return list(groups.values())
+
+def shared_categories(category):
+    """Every catalog category that scrapes exactly what this one does"""
+    key = snapshot_key(category)
+    return next(group for group in category_groups() if key in group)
+
+def get_fresh_snapshot(category):
+    """Newest snapshot for the category that is within SNAPSHOT_MAX_AGE, or None"""
+    cutoff = datetime.utcnow() - timedelta(seconds=Config.SNAPSHOT_MAX_AGE)
+    return CategorySnapshot.query\
+        .filter_by(category=snapshot_key(category))\
+        .filter(CategorySnapshot.created_at >= cutoff)\
+        .order_by(CategorySnapshot.created_at.desc()).first()
+
+def save_snapshot(category, results):
+    """Store results for every category sharing this one's config (caller commits)
+    
+    Expired snapshots of those categories are dropped at the same time.
+    """
+    keys = shared_categories(category)
+    cutoff = datetime.utcnow() - timedelta(seconds=Config.SNAPSHOT_MAX_AGE)
+    CategorySnapshot.query\
+        .filter(CategorySnapshot.category.in_(keys))\
+        .filter(CategorySnapshot.created_at < cutoff)\
+        .delete(synchronize_session=False)
+    
+    results_json = json.dumps(results)
+    snapshots = [
+        CategorySnapshot(
+            category=key,
+            results=results_json,
+            num_opportunities=len(results)
+        )
+        for key in keys
+    ]
+    db.session.add_all(snapshots)
+    return snapshots
+
+def warm_snapshots():
+    """Run the full pipeline once per distinct catalog config"""
+    for group in category_groups():
+        category = group[0]
+        run = claim_run(category)
+        if run is None:
+            print(f"⏭️  {category} is already being analysed by another worker")
+            continue
+        
+        try:
+            results = run_analysis(run)
+            finish_run(run)
+            if results:
+                save_snapshot(category, results)
+            db.session.commit()
+        except Exception as e:
+            print(f"❌ Warm-up failed for {category}: {e}")
+            db.session.rollback()
+            release_run(run)
+            continue
+        
+        if not results:
+            print(f"⚠️  No results for {category}, kept previous snapshot")
+            continue
+        
+        print(f"✅ Snapshot stored for {', '.join(group)} ({len(results)} opportunities)")
+
+@app.cli.command('warmup')
+@click.option('--interval', type=int, default=None,
+              help='Seconds between runs (defaults to SNAPSHOT_REFRESH_INTERVAL)')
+@click.option('--once', is_flag=True, help='Refresh every category once and exit')
+def warmup_command(interval, once):
+    """Precompute shared category snapshots on a schedule"""
+    interval = interval or Config.SNAPSHOT_REFRESH_INTERVAL
+    
+    while True:
+        warm_snapshots()
+        if once:
+            break
+        print(f"💤 Next warm-up in {interval}s")
+        time.sleep(interval)
+
+# Initialize database
+with app.app_context():
+    db.create_all()
+    # create_all skips tables that already exist, so add new indexes explicitly
+    for table in (Analysis.__table__, Opportunity.__table__):
+        for table_index in table.indexes:
+            table_index.create(db.engine, checkfirst=True)
+
 if __name__ == '__main__':
     app.run(debug=True, port=5000)
     
\ No newline at end of file
@@ -0,0 +1,94 @@
+# assets.py
+#
+# Build step: python assets.py
+# Minifies and content-hashes everything in static/ into static/dist/,
+# with .gz (and .br when the brotli package is installed) variants and a
+# manifest.json mapping original names to fingerprinted ones.
+
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+STATIC_DIR = os.path.join(BASE_DIR, 'static')
+DIST_DIR = os.path.join(STATIC_DIR, 'dist')
+MANIFEST_NAME = 'manifest.json'
+
+# Only text assets are worth precompressing
+COMPRESSIBLE = ('.css', '.js', '.svg', '.json', '.txt', '.html')
+
+def minify_css(text):
+    """Strip comments and whitespace from a stylesheet"""
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    text = re.sub(r'\s+', ' ', text)
+    text = re.sub(r'\s*([{};,>])\s*', r'\1', text)
+    text = re.sub(r':\s+', ':', text)
+    text = text.replace(';}', '}')
+    return text.strip()
+
+def fingerprint(name, content):
+    """style.css + content -> style.<hash>.css"""
+    root, ext = os.path.splitext(name)
+    digest = hashlib.sha256(content).hexdigest()[:12]
+    return f"{root}.{digest}{ext}"
+
+def build(static_dir=STATIC_DIR, dist_dir=DIST_DIR):
+    """Write fingerprinted, precompressed copies of every static file"""
+    if os.path.isdir(dist_dir):
+        shutil.rmtree(dist_dir)
+    os.makedirs(dist_dir)
+
+    manifest = {}
+    for root, dirs, files in os.walk(static_dir):
+        dirs[:] = [d for d in dirs if os.path.join(root, d) != dist_dir]
+
+        for filename in files:
+            source = os.path.join(root, filename)
+            name = os.path.relpath(source, static_dir).replace(os.sep, '/')
+
+            with open(source, 'rb') as f:
+                content = f.read()
+            if name.endswith('.css'):
+                content = minify_css(content.decode('utf-8')).encode('utf-8')
+
+            hashed = fingerprint(name, content)
+            target = os.path.join(dist_dir, hashed)
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, 'wb') as f:
+                f.write(content)
+
+            if name.endswith(COMPRESSIBLE):
+                with open(target + '.gz', 'wb') as f:
+                    f.write(gzip.compress(content, compresslevel=9, mtime=0))
+                if brotli:
+                    with open(target + '.br', 'wb') as f:
+                        f.write(brotli.compress(content))
+
+            manifest[name] = hashed
+            print(f"✅ {name} -> dist/{hashed}")
+
+    with open(os.path.join(dist_dir, MANIFEST_NAME), 'w') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+
+    if not brotli:
+        print("⚠️  brotli not installed, only gzip variants written")
+    return manifest
+
+def load_manifest(dist_dir=DIST_DIR):
+    """Manifest from the last build, or {} if assets were never built"""
+    try:
+        with open(os.path.join(dist_dir, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+if __name__ == '__main__':
+    build()
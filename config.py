@@ -22,4 +22,24 @@ class Config:
     
     # App Settings
     ANALYSES_PER_RUN = 30  # Reduced for faster testing
-    FREE_TIER_LIMIT = 10
\ No newline at end of file
+    FREE_TIER_LIMIT = 10
+
+    # Shared category snapshots (seconds)
+    SNAPSHOT_REFRESH_INTERVAL = int(os.getenv('SNAPSHOT_REFRESH_INTERVAL', 900))
+    SNAPSHOT_MAX_AGE = int(os.getenv('SNAPSHOT_MAX_AGE', 1800))
+
+    # Checkpointed runs
+    POST_MAX_ATTEMPTS = 2  # AI attempts per post before it is dropped
+    RUN_RESUME_WINDOW = 3600  # seconds an unfinished run stays resumable
+    RUN_STALL_TIMEOUT = 180  # seconds without a checkpoint before a run counts as dead
+
+    # Per-process user/profile cache (seconds)
+    USER_CACHE_TTL = 60
+
+    # Pagination
+    HISTORY_PAGE_SIZE = 10
+    RESULTS_PAGE_SIZE = 15
+
+    # Compression / static assets
+    COMPRESS_MIN_SIZE = 1024  # bytes; smaller HTML/JSON responses go out as-is
+    ASSET_MAX_AGE = 31536000  # one year, fingerprinted assets never change
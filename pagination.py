@@ -0,0 +1,74 @@
+# pagination.py
+
+import base64
+import json
+from datetime import datetime
+
+from sqlalchemy import and_, or_
+
+def encode_cursor(value, row_id):
+    """Opaque URL-safe cursor pointing just past (value, row_id)"""
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    raw = json.dumps([value, row_id]).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+def decode_cursor(cursor, is_datetime=False):
+    """Return (value, row_id) or None if the cursor is missing or malformed"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        position = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except ValueError:
+        return None
+
+    if not isinstance(position, list) or len(position) != 2:
+        return None
+    value, row_id = position
+
+    # Anything else would reach the database as a bind parameter
+    if not isinstance(row_id, int) or isinstance(row_id, bool):
+        return None
+    if is_datetime:
+        if not isinstance(value, str):
+            return None
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    elif not _is_number(value):
+        return None
+
+    return value, row_id
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+def keyset_page(query, sort_column, id_column, cursor=None, per_page=10):
+    """Fetch one page of query ordered by (sort_column, id_column) descending
+
+    Runs a single LIMIT query seeking past the cursor instead of using
+    OFFSET, so each page costs the same however deep it is. Returns
+    (rows, next_cursor) where next_cursor is None on the last page.
+    """
+    is_datetime = sort_column.type.python_type is datetime
+    position = decode_cursor(cursor, is_datetime=is_datetime)
+
+    if position:
+        value, last_id = position
+        query = query.filter(or_(
+            sort_column < value,
+            and_(sort_column == value, id_column < last_id)
+        ))
+
+    rows = query.order_by(sort_column.desc(), id_column.desc())\
+        .limit(per_page + 1).all()
+
+    next_cursor = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        last = rows[-1]
+        next_cursor = encode_cursor(getattr(last, sort_column.key), getattr(last, id_column.key))
+
+    return rows, next_cursor
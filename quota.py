@@ -0,0 +1,38 @@
+# quota.py
+
+from sqlalchemy import or_, update
+
+class QuotaManager:
+    """Atomic analysis-slot reservations (callers commit)"""
+
+    def __init__(self, db, user_model, limit):
+        self.db = db
+        self.user_model = user_model
+        self.limit = limit
+
+    def reserve(self, user_id):
+        """Take one analysis slot; False if the user is at the free-tier limit
+
+        The check and the increment are a single conditional UPDATE, so
+        concurrent requests can never push analyses_used past the limit.
+        """
+        User = self.user_model
+        result = self.db.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .where(or_(User.is_pro.is_(True), User.analyses_used < self.limit))
+            .values(analyses_used=User.analyses_used + 1)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount == 1
+
+    def release(self, user_id):
+        """Give back a slot taken by reserve() when the run failed"""
+        User = self.user_model
+        self.db.session.execute(
+            update(User)
+            .where(User.id == user_id)
+            .where(User.analyses_used > 0)
+            .values(analyses_used=User.analyses_used - 1)
+            .execution_options(synchronize_session=False)
+        )
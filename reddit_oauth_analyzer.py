@@ -4,6 +4,36 @@ import json
 import time
 from datetime import datetime
 
+# Simple categories for testing
+CATEGORIES = {
+    'marketing': {
+        'subreddits': ['startups'],
+        'keywords': ['problem']
+    },
+    'sales': {
+        'subreddits': ['startups'],
+        'keywords': ['difficult']
+    },
+    'productivity': {
+        'subreddits': ['startups'],
+        'keywords': ['struggling']
+    },
+    'developer_tools': {
+        'subreddits': ['programming'],
+        'keywords': ['annoying']
+    },
+    'general': {
+        'subreddits': ['startups'],
+        'keywords': ['problem']
+    }
+}
+
+class AnalysisIncomplete(Exception):
+    """Some posts failed AI analysis but can still be retried from the checkpoint"""
+
+class AnalysisFailed(Exception):
+    """Posts were scraped but not a single one could be analysed"""
+
 class RedditOAuthAnalyzer:
     def __init__(self, config, reddit_username=None, reddit_password=None):
         """Initialize with detailed logging"""
@@ -41,39 +71,23 @@ class RedditOAuthAnalyzer:
         self.groq_client = Groq(api_key=config['GROQ_API_KEY'])
         print("✅ Groq initialized\n")
     
-    def scrape_posts(self, category, limit=10):
-        """DIAGNOSTIC VERSION - prints everything"""
+    def scrape_posts(self, category, limit=10, checkpoint=None, on_checkpoint=None):
+        """DIAGNOSTIC VERSION - prints everything
+        
+        If a checkpoint dict is given, scraped posts and finished
+        subreddit/keyword batches are recorded in it (and on_checkpoint is
+        called after each batch) so a resumed run skips them.
+        """
         
         print("="*60)
         print(f"SCRAPING: {category}")
         print("="*60)
         
-        # Simple categories for testing
-        categories = {
-            'marketing': {
-                'subreddits': ['startups'],
-                'keywords': ['problem']
-            },
-            'sales': {
-                'subreddits': ['startups'],
-                'keywords': ['difficult']
-            },
-            'productivity': {
-                'subreddits': ['startups'],
-                'keywords': ['struggling']
-            },
-            'developer_tools': {
-                'subreddits': ['programming'],
-                'keywords': ['annoying']
-            },
-            'general': {
-                'subreddits': ['startups'],
-                'keywords': ['problem']
-            }
-        }
-        
-        config = categories.get(category.lower(), categories['general'])
-        posts = []
+        config = CATEGORIES.get(category.lower(), CATEGORIES['general'])
+        checkpoint = checkpoint if checkpoint is not None else {}
+        posts = checkpoint.setdefault('posts', [])
+        batches_done = checkpoint.setdefault('batches_done', [])
+        seen_ids = {post['id'] for post in posts}
         
         print(f"Subreddits: {config['subreddits']}")
         print(f"Keywords: {config['keywords']}")
@@ -85,6 +99,14 @@ class RedditOAuthAnalyzer:
             for keyword in config['keywords']:
                 print(f"\n  🔍 KEYWORD: '{keyword}'")
                 
+                batch = f"{subreddit_name}/{keyword}"
+                if batch in batches_done:
+                    print(f"  ⏭️  Already scraped (checkpoint)")
+                    continue
+                
+                if len(posts) >= limit:
+                    break
+                
                 try:
                     print(f"  Step 1: Getting subreddit object...")
                     subreddit = self.reddit.subreddit(subreddit_name)
@@ -111,6 +133,10 @@ class RedditOAuthAnalyzer:
                     for submission in results_list:
                         print(f"    Processing: {submission.title[:30]}...")
                         
+                        if submission.id in seen_ids:
+                            print(f"      ⏭️  Skip (already scraped)")
+                            continue
+                        
                         # Quick filters
                         if submission.score < 2:
                             print(f"      ⏭️  Skip (low score: {submission.score})")
@@ -149,6 +175,7 @@ class RedditOAuthAnalyzer:
                             'created_utc': submission.created_utc,
                             'comments': comments
                         })
+                        seen_ids.add(submission.id)
                         
                         print(f"      ✅ Added to results (total: {len(posts)})")
                         
@@ -164,6 +191,10 @@ class RedditOAuthAnalyzer:
                     traceback.print_exc()
                     continue
                 
+                batches_done.append(batch)
+                if on_checkpoint:
+                    on_checkpoint(checkpoint)
+                
                 if len(posts) >= limit:
                     break
                 
@@ -239,17 +270,32 @@ Return:
         score += wtp.get(analysis['willingness_to_pay'], 0)
         return min(1000, int(score))
     
-    def analyze_category(self, category, limit=5):
-        """Full pipeline - diagnostic version"""
+    def analyze_category(self, category, limit=5, checkpoint=None, on_checkpoint=None,
+                         max_attempts=2):
+        """Full pipeline - diagnostic version
+        
+        Progress is kept in the checkpoint dict and handed to on_checkpoint
+        after every scraped batch and every scored post. Passing a saved
+        checkpoint back in resumes the run: finished batches and scored posts
+        are skipped, batches that errored are scraped again, and only posts
+        that failed (fewer than max_attempts times) are sent to the AI again.
+        Raises AnalysisIncomplete while such retryable post failures remain,
+        and AnalysisFailed if every post used up its attempts (e.g. an AI
+        outage); the attempt counts are then reset so a later retry scores
+        the already-scraped posts again.
+        """
         
         print("\n" + "="*60)
         print(f"STARTING ANALYSIS: {category}")
         print("="*60 + "\n")
         
         start_time = time.time()
+        checkpoint = checkpoint if checkpoint is not None else {}
         
-        # Scrape
-        posts = self.scrape_posts(category, limit=limit)
+        # Scrape (batches finished in an earlier attempt are skipped,
+        # batches that failed are tried again)
+        posts = self.scrape_posts(category, limit=limit,
+                                  checkpoint=checkpoint, on_checkpoint=on_checkpoint)
         
         if not posts:
             print("❌ No posts found!\n")
@@ -257,18 +303,50 @@ Return:
         
         print(f"\n🤖 ANALYZING {len(posts)} POSTS WITH AI\n")
         
-        results = []
+        analyses = checkpoint.setdefault('analyses', {})
+        attempts = checkpoint.setdefault('attempts', {})
+        
         for i, post in enumerate(posts, 1):
             print(f"[{i}/{len(posts)}] {post['title'][:40]}...")
             
+            if post['id'] in analyses:
+                print(f"  ⏭️  Already analyzed (checkpoint)")
+                continue
+            
+            if attempts.get(post['id'], 0) >= max_attempts:
+                print(f"  ⏭️  Giving up after {max_attempts} failed attempts")
+                continue
+            
             analysis = self.analyze_post(post)
             
+            attempts[post['id']] = attempts.get(post['id'], 0) + 1
             if analysis:
-                post['analysis'] = analysis
-                results.append(post)
+                analyses[post['id']] = analysis
+            if on_checkpoint:
+                on_checkpoint(checkpoint)
             
             time.sleep(0.5)
         
+        retryable = [
+            post for post in posts
+            if post['id'] not in analyses and attempts.get(post['id'], 0) < max_attempts
+        ]
+        if retryable:
+            raise AnalysisIncomplete(
+                f"{len(retryable)} posts failed AI analysis; resume the run to retry them"
+            )
+        
+        if not analyses:
+            checkpoint['attempts'] = {}
+            if on_checkpoint:
+                on_checkpoint(checkpoint)
+            raise AnalysisFailed(f"AI analysis failed for all {len(posts)} posts, please try again later")
+        
+        results = [
+            dict(post, analysis=analyses[post['id']])
+            for post in posts
+            if post['id'] in analyses
+        ]
         results.sort(key=lambda x: x['analysis']['opportunity_score'], reverse=True)
         
         elapsed = time.time() - start_time